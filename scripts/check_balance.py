@@ -9,11 +9,13 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
 ROOT = Path(__file__).resolve().parents[1]
 ENV_PATH = ROOT / ".env"
+CREDS_CACHE_PATH = ROOT / ".polymarket_creds.json"
 
 try:
     from py_clob_client.client import ClobClient
@@ -30,11 +32,46 @@ def require_env(name: str) -> str:
     return val
 
 
+def load_cached_creds(proxy_address: str) -> Optional[ApiCreds]:
+    """Return API creds derived by a previous run for the same proxy wallet, if any."""
+    try:
+        data = json.loads(CREDS_CACHE_PATH.read_text())
+        if data.get("proxy_address") != proxy_address:
+            return None
+        return ApiCreds(
+            api_key=data["api_key"],
+            api_secret=data["api_secret"],
+            api_passphrase=data["api_passphrase"],
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_cached_creds(proxy_address: str, creds: ApiCreds) -> None:
+    payload = {
+        "proxy_address": proxy_address,
+        "api_key": creds.api_key,
+        "api_secret": creds.api_secret,
+        "api_passphrase": creds.api_passphrase,
+    }
+    fd = os.open(CREDS_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f)
+
+
+def clear_cached_creds() -> None:
+    try:
+        CREDS_CACHE_PATH.unlink()
+    except FileNotFoundError:
+        pass
+
+
 def build_client() -> ClobClient:
     load_dotenv(ENV_PATH)
+    get = os.environ.get
     private_key = require_env("POLYMARKET_PRIVATE_KEY")
     proxy_address = require_env("POLYMARKET_PROXY_ADDRESS")
-    signature_type = int(os.getenv("POLYMARKET_SIGNATURE_TYPE", "1"))
+    signature_type = int(get("POLYMARKET_SIGNATURE_TYPE", "1"))
 
     client = ClobClient(
         host="https://clob.polymarket.com",
@@ -44,9 +81,9 @@ def build_client() -> ClobClient:
         funder=proxy_address,
     )
 
-    api_key = os.getenv("POLYMARKET_API_KEY")
-    api_secret = os.getenv("POLYMARKET_API_SECRET")
-    api_passphrase = os.getenv("POLYMARKET_API_PASSPHRASE")
+    api_key = get("POLYMARKET_API_KEY")
+    api_secret = get("POLYMARKET_API_SECRET")
+    api_passphrase = get("POLYMARKET_API_PASSPHRASE")
     if api_key and api_secret and api_passphrase:
         creds = ApiCreds(
             api_key=api_key,
@@ -54,7 +91,12 @@ def build_client() -> ClobClient:
             api_passphrase=api_passphrase,
         )
     else:
-        creds = client.create_or_derive_api_creds()
+        # Deriving creds costs a signed round-trip to the CLOB; reuse the last result when possible.
+        creds = load_cached_creds(proxy_address)
+        if creds is None:
+            creds = client.create_or_derive_api_creds()
+            if creds:
+                save_cached_creds(proxy_address, creds)
 
     if not creds:
         raise SystemExit("Unable to obtain Polymarket API credentials.")
@@ -66,7 +108,13 @@ def build_client() -> ClobClient:
 def main() -> None:
     client = build_client()
     params = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL, token_id="", signature_type=None)
-    info = client.get_balance_allowance(params)
+    try:
+        info = client.get_balance_allowance(params)
+    except Exception as exc:
+        if getattr(exc, "status_code", None) in (401, 403):
+            # Cached creds may have been revoked; force a fresh derive next time.
+            clear_cached_creds()
+        raise
     print(json.dumps(info, indent=2))
 
 
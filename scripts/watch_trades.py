@@ -9,11 +9,22 @@ new trades in real time so you can confirm data is flowing.
 import argparse
 import asyncio
 import datetime as dt
+import json
 from typing import Dict, List
 
 import aiohttp
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
+
 DATA_API = "https://data-api.polymarket.com"
+# Page size bounds; between them the limit follows the wallet's recent trade rate.
+MIN_LIMIT = 10
+MAX_LIMIT = 500
 
 
 async def fetch_trades(session: aiohttp.ClientSession, wallet: str, limit: int = 50) -> List[Dict]:
@@ -25,26 +36,50 @@ async def fetch_trades(session: aiohttp.ClientSession, wallet: str, limit: int =
     }
     async with session.get(f"{DATA_API}/trades", params=params) as resp:
         resp.raise_for_status()
-        return await resp.json()
+        return _json_loads(await resp.read())
+
+
+def next_limit(new_count: int) -> int:
+    """Ask for ~3x the trades seen last poll, so quiet wallets transfer and parse only a few rows."""
+    return min(MAX_LIMIT, max(MIN_LIMIT, new_count * 3))
+
+
+async def fetch_since(session: aiohttp.ClientSession, wallet: str, last_ts: int, limit: int) -> List[Dict]:
+    trades = await fetch_trades(session, wallet, limit)
+    # A full page of unseen trades may have cut some off: widen the page and fetch again.
+    while (
+        last_ts
+        and limit < MAX_LIMIT
+        and len(trades) >= limit
+        and min(int(t.get("timestamp", 0)) for t in trades) > last_ts
+    ):
+        limit = min(MAX_LIMIT, limit * 4)
+        trades = await fetch_trades(session, wallet, limit)
+    return trades
 
 
 async def watch(wallet: str, poll_interval: float) -> None:
     last_ts = 0
-    async with aiohttp.ClientSession() as session:
+    limit = 50
+    connector = aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=75, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
         while True:
             try:
-                trades = await fetch_trades(session, wallet)
+                trades = await fetch_since(session, wallet, last_ts, limit)
                 trades.sort(key=lambda t: int(t.get("timestamp", 0)))
+                new_count = 0
                 for tr in trades:
                     ts = int(tr.get("timestamp", 0))
                     if ts <= last_ts:
                         continue
                     last_ts = ts
+                    new_count += 1
                     print(
                         f"[{dt.datetime.utcfromtimestamp(ts).isoformat()}Z] "
                         f"{tr.get('title')} | {tr.get('side')} {tr.get('size')} @ {tr.get('price')} "
                         f"(wallet {wallet})"
                     )
+                limit = next_limit(new_count)
             except Exception as exc:
                 print(f"Error fetching trades: {exc}")
             await asyncio.sleep(poll_interval)
@@ -1,18 +1,29 @@
 import asyncio
-from collections import defaultdict
+import contextlib
+import csv
 import os
 import signal
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
 
 import click
 
-from .config_manager import ConfigManager, ConfigError
-from .utils import append_csv_row, load_env, persist_state, read_state, setup_logging
+from .config_manager import ConfigManager, ConfigError, MonitoringCfg
+from .utils import ensure_dir, load_env, persist_state, read_state, setup_logging
 
 
 STATE_PATH = "state/copytrade_state.json"
+# The trade log is flushed + fsynced once this many rows are buffered, or after this many seconds.
+TRADE_LOG_FLUSH_ROWS = 64
+TRADE_LOG_FLUSH_SECONDS = 0.5
+# Trades/sec above which the loop re-polls immediately instead of sleeping poll_interval.
+BUSY_TRADE_RATE = 2.0
 TRADE_LOG_HEADERS = [
     "timestamp",
     "event_type",
@@ -38,47 +49,107 @@ TRADE_LOG_HEADERS = [
 ]
 
 
+@dataclass(slots=True)
+class TradeRow:
+    """One line of the trade log; fields are declared in TRADE_LOG_HEADERS order."""
+
+    timestamp: str
+    event_type: str
+    trader_name: Optional[str]
+    trader_wallet: str
+    market: Optional[str]
+    title: Optional[str]
+    outcome: Optional[str]
+    side: Optional[str]
+    trader_size: Optional[float]
+    trader_price: Optional[float]
+    mirror_shares: float
+    mirror_usd: float
+    reason: str
+    order_status: Optional[str]
+    order_id: Optional[str]
+    notes: Optional[str]
+    stats_copied_trades: int
+    stats_copied_usd: str
+    stats_rejected_trades: int
+    stats_failed_trades: int
+    stats_dry_run_trades: int
+
+
+_trade_row_values = attrgetter(*TRADE_LOG_HEADERS)
+
+
+@dataclass(slots=True)
+class TraderStats:
+    copied_trades: int = 0
+    copied_usd: float = 0.0
+    rejected_trades: int = 0
+    failed_trades: int = 0
+    dry_run_trades: int = 0
+
+
 class CopyTraderApp:
     def __init__(self, cfg_path: str):
         self.cfg_path = cfg_path
+        self._cfg_path_obj = Path(cfg_path)
         self.cfg: Dict[str, Any] = {}
         self.logger = None
         self.running = True
+        self._stop_event = asyncio.Event()
         self.portfolio_tracker = None
         self.monitor = None
         self.risk_manager = None
         self.executor = None
+        self.http_session = None
         self.config_mtime: float = 0.0
+        self._attempted_config_mtime: float = 0.0
+        self._config_poll_tick = 0
         self.enabled_wallets: Set[str] = set()
+        self._enabled_traders: List[Dict[str, Any]] = []
         self.poll_interval = 5
         self.portfolio_sync_interval = 60
-        self.trader_stats = defaultdict(
-            lambda: {
-                "copied_trades": 0,
-                "copied_usd": 0.0,
-                "rejected_trades": 0,
-                "failed_trades": 0,
-                "dry_run_trades": 0,
-            }
-        )
+        self._sync_sema: Optional[asyncio.Semaphore] = None
+        self._sync_limit = 0
+        self.trader_stats: Dict[str, TraderStats] = {}  # interned lowercase wallet -> counters
         self.trades_file = None
+        self._trade_log_queue: "asyncio.Queue[Optional[TradeRow]]" = asyncio.Queue()
+        self._trade_log_task: Optional[asyncio.Task] = None
+        self._portfolio_sync_task: Optional[asyncio.Task] = None
+        self._iso_second_cache: Tuple[int, str] = (-1, "")
+        self._csv_fh: Optional[IO[str]] = None
+        self._csv_writer = None
         self.trade_recorder = None
         self.trade_recorder_task = None
         self.trade_tracking_cfg: Dict[str, Any] = {}
         self._active_trade_tracking_cfg: Dict[str, Any] = {}
         self._trade_recorder_update_needed = False
+        self.config_watcher = None
+        self._config_watch_task = None
+        self._state_queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(maxsize=1)
+        self._state_writer_task: Optional[asyncio.Task] = None
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._last_snapshot_hash: Optional[int] = None
 
     def stop(self, *_):
         if self.logger:
             self.logger.info("Stopping copytrader...")
         self.running = False
+        self._stop_event.set()
 
     async def run(self):
+        loop = asyncio.get_running_loop()
+
+        # Run coroutines eagerly until their first suspension (Python 3.12+), so cache hits
+        # and early rejects in gathered tasks skip a round-trip through the ready queue.
+        eager_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_factory is not None:
+            loop.set_task_factory(eager_factory)
+
         load_env()
         cfg_mgr = ConfigManager(self.cfg_path)
         self.cfg = cfg_mgr.load()
-        self.config_mtime = Path(self.cfg_path).stat().st_mtime if Path(self.cfg_path).exists() else 0.0
-        self.enabled_wallets = self._enabled_wallets(self.cfg)
+        self.config_mtime = self._cfg_path_obj.stat().st_mtime if self._cfg_path_obj.exists() else 0.0
+        self.enabled_wallets, self._enabled_traders = self._enabled_wallets(self.cfg)
         self.trade_tracking_cfg = self.cfg.get("trade_tracking", {})
         self._trade_recorder_update_needed = True
 
@@ -89,141 +160,289 @@ class CopyTraderApp:
         self.logger = setup_logging(log_level, log_file)
 
         # Lazy import runtime components to avoid requiring all deps for non-start commands
+        from .http_pool import close_shared_session, get_shared_session
         from .portfolio_tracker import PortfolioTracker
         from .monitor import MultiTraderMonitor
         from .risk_manager import RiskManager
 
-        self.portfolio_tracker = PortfolioTracker()
-        self.monitor = MultiTraderMonitor(self.cfg["traders"])
-        self.risk_manager = RiskManager(self.cfg["risk_management"], self.portfolio_tracker)
-
-        # Lazy import executor to allow status command without dependency
-        from .executor import TradeExecutor, MissingDependency
-
+        # Everything acquired from here on (session, watcher, pools, tasks) is released by the
+        # finally below, including when setup itself fails part-way.
         try:
-            self.executor = TradeExecutor(self.cfg["your_account"])
-        except MissingDependency:
-            self.logger.error("py-clob-client not installed. Install dependencies to place orders.")
-            self.executor = None  # type: ignore
-
-        self.poll_interval = int(self.cfg["monitoring"]["poll_interval"]) or 5
-        self.portfolio_sync_interval = int(self.cfg["monitoring"]["portfolio_sync_interval"]) or 60
-
-        await self._reconcile_trade_recorder(log_level)
-
-        # Initial portfolio sync so we have deployment stats before processing trades
-        await self._sync_enabled_portfolios()
-        last_portfolio_sync = asyncio.get_event_loop().time()
-
-        # Handle signals for graceful shutdown
-        signal.signal(signal.SIGINT, self.stop)
-        signal.signal(signal.SIGTERM, self.stop)
-
-        enabled = [
-            f"{t.get('name', t['wallet_address'])} ({t['wallet_address']})"
-            for t in self.cfg["traders"]
-            if t.get("enabled")
-        ]
-        if enabled:
-            self.logger.info("Starting multi-trader copytrader...")
-            self.logger.info("Watching %d traders:", len(enabled))
-            for entry in enabled:
-                self.logger.info(f"- {entry}")
-        else:
-            self.logger.info("Starting copytrader with no enabled traders.")
+            # One keep-alive pool for all Data API traffic (portfolio, monitor and trade recorder).
+            self.http_session = await get_shared_session()
+            self.portfolio_tracker = PortfolioTracker(session=self.http_session)
+            self.monitor = MultiTraderMonitor(
+                self.cfg["traders"],
+                session=self.http_session,
+                max_concurrency=self.cfg["monitoring_typed"].max_poll_concurrency,
+            )
+            self.risk_manager = RiskManager(self.cfg["risk_management"], self.portfolio_tracker)
+
+            # Lazy import executor to allow status command without dependency
+            from .executor import TradeExecutor, MissingDependency
+
+            try:
+                self.executor = TradeExecutor(self.cfg["your_account"])
+            except MissingDependency:
+                self.logger.error("py-clob-client not installed. Install dependencies to place orders.")
+                self.executor = None  # type: ignore
+
+            monitoring: MonitoringCfg = self.cfg["monitoring_typed"]
+            self.poll_interval = monitoring.poll_interval
+            self.portfolio_sync_interval = monitoring.portfolio_sync_interval
+            self._set_sync_limit(monitoring.max_sync_concurrency)
+
+            await self._reconcile_trade_recorder(log_level)
+
+            # Prefer filesystem notifications for config reloads; fall back to mtime polling.
+            from .config_watcher import ConfigWatcher
+
+            self.config_watcher = ConfigWatcher(self.cfg_path)
+            if self.config_watcher.start():
+                self._config_watch_task = asyncio.create_task(self._watch_config())
+            else:
+                self.logger.debug("watchdog unavailable; polling config mtime each iteration.")
+
+            # Dedicated single worker: state writes stay ordered and don't queue behind other to_thread work.
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-io")
+            self._state_writer_task = asyncio.create_task(self._state_writer())
+            self._trade_log_task = asyncio.create_task(self._trade_log_flusher())
+
+            # Initial portfolio sync so we have deployment stats before processing trades
+            try:
+                await self._sync_enabled_portfolios()
+            except Exception as exc:
+                self.logger.error(f"Initial portfolio sync failed: {exc}")
+            self._portfolio_sync_task = asyncio.create_task(self._portfolio_sync_loop())
+
+            # Handle signals for graceful shutdown; loop-level handlers wake the poll sleep immediately.
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, self.stop)
+                except NotImplementedError:  # pragma: no cover - Windows event loops
+                    signal.signal(sig, lambda *_: loop.call_soon_threadsafe(self.stop))
+
+            enabled = [
+                f"{t.get('name', t['wallet_address'])} ({t['wallet_address']})"
+                for t in self._enabled_traders
+            ]
+            if enabled:
+                self.logger.info("Starting multi-trader copytrader...")
+                self.logger.info("Watching %d traders:", len(enabled))
+                for entry in enabled:
+                    self.logger.info(f"- {entry}")
+            else:
+                self.logger.info("Starting copytrader with no enabled traders.")
+
+            # Bind hot-path callables once; the per-trade loop below would otherwise re-resolve them.
+            calc_batch = self.risk_manager.calculate_mirror_batch
+            validate = self.risk_manager.validate_trade
+            update_exposure = self.risk_manager.update_exposure
+            log_event = self._log_trade_event
+            logger_info = self.logger.info
+            logger_warn = self.logger.warning
+            logger_error = self.logger.error
+            executor = self.executor
 
-        try:
             while self.running:
-                now = asyncio.get_event_loop().time()
-
-                self._maybe_reload_config()
+                processed = 0
+                if not self.config_watcher.active:
+                    await self._poll_config()
                 await self._reconcile_trade_recorder(log_level)
 
-                # 1) Periodic portfolio sync
-                if now - last_portfolio_sync >= self.portfolio_sync_interval:
-                    await self._sync_enabled_portfolios()
-                    last_portfolio_sync = now
-
-                # 2) Fetch new trades for all traders
-                all_lists = await self.monitor.monitor_all_traders()
-                new_trades = [t for sub in all_lists for t in sub]
-
-                # 3) Process trades
-                for tr in new_trades:
-                    mirror_shares, reason, mirror_usd = self.risk_manager.calculate_mirror(tr)
-                    if mirror_shares <= 0:
-                        if self.logger:
-                            self.logger.info(
-                                f"Skip {tr['trader_name']} trade: {reason} (mirror shares {mirror_shares:.4f})"
+                # 1) Fetch and process new trades as each trader's poll completes
+                async for batch in self.monitor.stream_trade_batches():
+                    sizing = calc_batch(batch)
+                    for tr, (mirror_shares, reason, mirror_usd) in zip(batch, sizing):
+                        processed += 1
+                        name = tr["trader_name"]
+                        if processed & 7 == 0:
+                            # Let other tasks (flushers, recorder) run during long bursts.
+                            await asyncio.sleep(0)
+                        if mirror_shares <= 0:
+                            logger_info(f"Skip {name} trade: {reason} (mirror shares {mirror_shares:.4f})")
+                            continue
+
+                        ok, msg = validate(tr, mirror_shares, mirror_usd)
+                        if not ok:
+                            logger_warn(f"Rejected trade from {name}: {msg}")
+                            log_event("rejected", tr, 0.0, mirror_usd, msg, {})
+                            continue
+
+                        if executor is None:
+                            logger_info(f"Dry-run: Would copy {name} ${mirror_usd:.2f} ({reason})")
+                            update_exposure(tr, mirror_usd)
+                            log_event("dry_run", tr, mirror_shares, mirror_usd, reason, {"status": "dry_run"})
+                            continue
+
+                        res = await executor.execute_mirror_trade(tr, mirror_shares)
+                        if res.get("success"):
+                            exec_usd = float(res.get("executed_usd", mirror_usd))
+                            exec_shares = float(res.get("executed_shares", mirror_shares))
+                            reason_text = reason
+                            if res.get("note"):
+                                reason_text = f"{reason_text}; {res['note']}"
+                            logger_info(
+                                f"Copied {name}: ${exec_usd:.2f} ({reason_text}) order={res.get('order_id')}"
                             )
-                        continue
-
-                    ok, msg = self.risk_manager.validate_trade(tr, mirror_shares, mirror_usd)
-                    if not ok:
-                        self.logger.warning(f"Rejected trade from {tr['trader_name']}: {msg}")
-                        self._log_trade_event("rejected", tr, 0.0, mirror_usd, msg, {})
-                        continue
-
-                    if self.executor is None:
-                        self.logger.info(
-                            f"Dry-run: Would copy {tr['trader_name']} ${mirror_usd:.2f} ({reason})"
-                        )
-                        self.risk_manager.update_exposure(tr, mirror_usd)
-                        self._log_trade_event("dry_run", tr, mirror_shares, mirror_usd, reason, {"status": "dry_run"})
-                        continue
-
-                    res = await self.executor.execute_mirror_trade(tr, mirror_shares)
-                    if res.get("success"):
-                        exec_usd = float(res.get("executed_usd", mirror_usd))
-                        exec_shares = float(res.get("executed_shares", mirror_shares))
-                        reason_text = reason
-                        if res.get("note"):
-                            reason_text = f"{reason_text}; {res['note']}"
-                        self.logger.info(
-                            f"Copied {tr['trader_name']}: ${exec_usd:.2f} ({reason_text}) order={res.get('order_id')}"
-                        )
-                        self.risk_manager.update_exposure(tr, exec_usd)
-                        self._log_trade_event("executed", tr, exec_shares, exec_usd, reason_text, res)
-                    else:
-                        self.logger.error(f"Order failed: {res.get('error')}")
-                        self._log_trade_event("failed", tr, mirror_shares, mirror_usd, res.get("error", ""), res)
-
-                # 4) Persist status snapshot
-                snapshot = {
-                    "global_exposure_usd": self.risk_manager.global_exposure_usd,
-                    "per_trader_exposure_usd": self.risk_manager.current_exposure_usd,
-                    "portfolios": self.portfolio_tracker.portfolios,
-                }
-                persist_state(STATE_PATH, snapshot)
-
-                await asyncio.sleep(self.poll_interval)
+                            update_exposure(tr, exec_usd)
+                            log_event("executed", tr, exec_shares, exec_usd, reason_text, res)
+                        else:
+                            logger_error(f"Order failed: {res.get('error')}")
+                            log_event("failed", tr, mirror_shares, mirror_usd, res.get("error", ""), res)
+
+                # 2) Persist status snapshot (only when exposures or portfolios changed)
+                self._maybe_queue_state()
+
+                if processed >= self.poll_interval * BUSY_TRADE_RATE:
+                    # Busy traders: more trades are likely queued up, so poll again right away.
+                    await asyncio.sleep(0)
+                    continue
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
         finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.remove_signal_handler(sig)
+                except NotImplementedError:  # pragma: no cover - Windows event loops
+                    pass
+            await self._stop_portfolio_sync()
+            await self._stop_trade_log_flusher()
+            self._close_trade_log()
+            await self._stop_config_watcher()
+            await self._stop_state_writer()
             await self._stop_trade_recorder()
+            if self.executor:
+                self.executor.close()
+            await close_shared_session()
+
+    def _maybe_queue_state(self) -> None:
+        exposure = self.risk_manager.current_exposure_usd
+        snapshot_hash = hash(
+            (
+                self.risk_manager.global_exposure_usd,
+                tuple(sorted(exposure.items())),
+                self.portfolio_tracker.version,
+            )
+        )
+        if snapshot_hash == self._last_snapshot_hash:
+            return
+        self._last_snapshot_hash = snapshot_hash
+        # Copy the dicts: the writer serializes them off-loop while trading continues.
+        self._queue_state(
+            {
+                "global_exposure_usd": self.risk_manager.global_exposure_usd,
+                "per_trader_exposure_usd": dict(exposure),
+                "portfolios": dict(self.portfolio_tracker.portfolios),
+            }
+        )
+
+    def _queue_state(self, snapshot: Dict[str, Any]) -> None:
+        """Hand a snapshot to the writer, replacing any snapshot it hasn't picked up yet."""
+        if self._state_queue.full():
+            self._state_queue.get_nowait()
+        self._state_queue.put_nowait(snapshot)
+
+    async def _state_writer(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            snapshot = await self._state_queue.get()
+            if snapshot is None:
+                return
+            try:
+                await loop.run_in_executor(self._io_pool, persist_state, STATE_PATH, snapshot)
+            except Exception as exc:
+                self.logger.error(f"Failed to persist state: {exc}")
+
+    async def _stop_state_writer(self) -> None:
+        task = self._state_writer_task
+        self._state_writer_task = None
+        if task and not task.done():
+            # The sentinel queues behind any pending snapshot, so the latest state is written first.
+            await self._state_queue.put(None)
+            await task
+        if self._io_pool:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+
+    async def _watch_config(self) -> None:
+        events = self.config_watcher.events
+        while True:
+            await events.get()
+            # Editors often emit several events per save; coalesce them into one reload.
+            while not events.empty():
+                events.get_nowait()
+            await self._try_reload_config()
+
+    async def _try_reload_config(self) -> None:
+        # A bad edit (YAML syntax, failed validation, missing keys) must not end config watching.
+        try:
+            await self._maybe_reload_config()
+        except ConfigError as exc:
+            self.logger.error(f"Ignoring invalid config change: {exc}")
+        except Exception as exc:
+            self.logger.error(f"Ignoring config change that failed to load: {exc}")
+
+    async def _stop_config_watcher(self) -> None:
+        if self.config_watcher:
+            self.config_watcher.stop()
+        if not self._config_watch_task:
+            return
+        self._config_watch_task.cancel()
+        try:
+            await self._config_watch_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            # Shutdown must carry on to the state writer and recorder regardless.
+            self.logger.error(f"Config watcher ended with an error: {exc}")
+        self._config_watch_task = None
+
+    async def _poll_config(self) -> None:
+        """Fallback without a watcher: config edits are rare, so only stat about every 30s."""
+        self._config_poll_tick += 1
+        if self._config_poll_tick < max(1, int(30 / self.poll_interval)):
+            return
+        self._config_poll_tick = 0
+        await self._try_reload_config()
 
-    def _maybe_reload_config(self) -> None:
-        cfg_file = Path(self.cfg_path)
+    async def _maybe_reload_config(self) -> None:
         try:
-            mtime = cfg_file.stat().st_mtime
+            mtime = self._cfg_path_obj.stat().st_mtime
         except FileNotFoundError:
             return
-        if mtime <= self.config_mtime:
+        if mtime <= self.config_mtime or mtime == self._attempted_config_mtime:
             return
+        # Remember the version being tried: if it fails to load, further events for the same
+        # broken file are skipped (and the error logged once) until it is saved again.
+        self._attempted_config_mtime = mtime
 
+        # YAML parsing can take a while on large configs; keep it off the event loop.
         cfg_mgr = ConfigManager(self.cfg_path)
-        new_cfg = cfg_mgr.load()
-        self.config_mtime = mtime
+        new_cfg = await asyncio.to_thread(cfg_mgr.load)
+
+        # Everything that can still reject the new config runs before any state is swapped,
+        # so a failed reload leaves the previous config fully in effect.
+        monitoring: MonitoringCfg = new_cfg["monitoring_typed"]
+        traders = new_cfg["traders"]
+        if self.risk_manager:
+            self.risk_manager.update_config(new_cfg["risk_management"])
 
-        old_enabled = self.enabled_wallets
+        self.config_mtime = mtime
         self.cfg = new_cfg
-        self.enabled_wallets = self._enabled_wallets(new_cfg)
+        self.enabled_wallets, self._enabled_traders = self._enabled_wallets(new_cfg)
         self.trade_tracking_cfg = self.cfg.get("trade_tracking", {})
         self._trade_recorder_update_needed = True
-        newly_enabled = self.monitor.update_traders(new_cfg["traders"]) if self.monitor else set()
+        newly_enabled = set()
+        if self.monitor:
+            newly_enabled = self.monitor.update_traders(traders)
+            self.monitor.set_max_concurrency(monitoring.max_poll_concurrency)
 
-        self.poll_interval = int(new_cfg["monitoring"]["poll_interval"]) or 5
-        self.portfolio_sync_interval = int(new_cfg["monitoring"]["portfolio_sync_interval"]) or 60
-        if self.risk_manager:
-            self.risk_manager.update_config(new_cfg["risk_management"])
+        self.poll_interval = monitoring.poll_interval
+        self.portfolio_sync_interval = monitoring.portfolio_sync_interval
+        self._set_sync_limit(monitoring.max_sync_concurrency)
 
         if newly_enabled and self.logger:
             for trader in new_cfg["traders"]:
@@ -232,13 +451,17 @@ class CopyTraderApp:
                         f"Now mirroring {trader.get('name', trader['wallet_address'])} ({trader['wallet_address']})"
                     )
 
+    def _set_sync_limit(self, limit: int) -> None:
+        """(Re)build the portfolio sync semaphore; syncs already holding a slot finish under the old one."""
+        if limit != self._sync_limit:
+            self._sync_limit = limit
+            self._sync_sema = asyncio.Semaphore(limit)
+
     @staticmethod
-    def _enabled_wallets(cfg: Dict[str, Any]) -> Set[str]:
-        return {
-            str(t.get("wallet_address", "")).lower()
-            for t in cfg.get("traders", [])
-            if t.get("enabled")
-        }
+    def _enabled_wallets(cfg: Dict[str, Any]) -> Tuple[Set[str], List[Dict[str, Any]]]:
+        """Return the enabled wallets (lowercased) and the enabled trader entries."""
+        traders = [t for t in cfg.get("traders", []) if t.get("enabled")]
+        return {str(t.get("wallet_address", "")).lower() for t in traders}, traders
 
     def _log_trade_event(
         self,
@@ -253,54 +476,159 @@ class CopyTraderApp:
             return
 
         wallet = trade["trader_wallet"]
-        stats = self.trader_stats[wallet]
+        key = wallet.lower()
+        stats = self.trader_stats.get(key)
+        if stats is None:
+            stats = self.trader_stats[sys.intern(key)] = TraderStats()
 
         if event_type == "executed":
-            stats["copied_trades"] += 1
-            stats["copied_usd"] += mirror_usd
+            stats.copied_trades += 1
+            stats.copied_usd += mirror_usd
         elif event_type == "rejected":
-            stats["rejected_trades"] += 1
+            stats.rejected_trades += 1
         elif event_type == "failed":
-            stats["failed_trades"] += 1
+            stats.failed_trades += 1
         elif event_type == "dry_run":
-            stats["dry_run_trades"] += 1
+            stats.dry_run_trades += 1
 
         note = extra.get("error") or extra.get("note")
-        row = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "event_type": event_type,
-            "trader_name": trade.get("trader_name"),
-            "trader_wallet": wallet,
-            "market": trade.get("market"),
-            "title": trade.get("title"),
-            "outcome": trade.get("outcome"),
-            "side": trade.get("side"),
-            "trader_size": trade.get("size"),
-            "trader_price": trade.get("price"),
-            "mirror_shares": mirror_shares,
-            "mirror_usd": mirror_usd,
-            "reason": reason,
-            "order_status": extra.get("status"),
-            "order_id": extra.get("order_id"),
-            "notes": note,
-            "stats_copied_trades": stats["copied_trades"],
-            "stats_copied_usd": f"{stats['copied_usd']:.2f}",
-            "stats_rejected_trades": stats["rejected_trades"],
-            "stats_failed_trades": stats["failed_trades"],
-            "stats_dry_run_trades": stats["dry_run_trades"],
-        }
-        append_csv_row(self.trades_file, TRADE_LOG_HEADERS, row)
+        row = TradeRow(
+            timestamp=self._utc_now_iso(),
+            event_type=event_type,
+            trader_name=trade.get("trader_name"),
+            trader_wallet=wallet,
+            market=trade.get("market"),
+            title=trade.get("title"),
+            outcome=trade.get("outcome"),
+            side=trade.get("side"),
+            trader_size=trade.get("size"),
+            trader_price=trade.get("price"),
+            mirror_shares=mirror_shares,
+            mirror_usd=mirror_usd,
+            reason=reason,
+            order_status=extra.get("status"),
+            order_id=extra.get("order_id"),
+            notes=note,
+            stats_copied_trades=stats.copied_trades,
+            stats_copied_usd=f"{stats.copied_usd:.2f}",
+            stats_rejected_trades=stats.rejected_trades,
+            stats_failed_trades=stats.failed_trades,
+            stats_dry_run_trades=stats.dry_run_trades,
+        )
+        self._trade_log_queue.put_nowait(row)
+
+    def _utc_now_iso(self) -> str:
+        """ISO-8601 UTC timestamp with microseconds; the date/time part is formatted once per second."""
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        cached_sec, prefix = self._iso_second_cache
+        if sec != cached_sec:
+            prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            self._iso_second_cache = (sec, prefix)
+        return f"{prefix}.{ns // 1000:06d}+00:00"
+
+    async def _trade_log_flusher(self) -> None:
+        """Drain queued rows into the buffered trade log; flush + fsync every 64 rows or 500 ms."""
+        queue = self._trade_log_queue
+        loop = asyncio.get_running_loop()
+        unflushed = 0
+        last_flush = loop.time()
+        while True:
+            rows: List[Optional[TradeRow]] = []
+            try:
+                # With unflushed rows pending, wake up in time to honour the flush interval.
+                timeout = TRADE_LOG_FLUSH_SECONDS if unflushed else None
+                rows.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                pass
+            while len(rows) < TRADE_LOG_FLUSH_ROWS and not queue.empty():
+                rows.append(queue.get_nowait())
+            done = None in rows
+            rows = [r for r in rows if r is not None]
+            try:
+                if rows:
+                    self._write_trade_rows(rows)
+                    unflushed += len(rows)
+                now = loop.time()
+                if unflushed and (
+                    done or unflushed >= TRADE_LOG_FLUSH_ROWS or now - last_flush >= TRADE_LOG_FLUSH_SECONDS
+                ):
+                    await asyncio.to_thread(self._sync_trade_log)
+                    unflushed = 0
+                    last_flush = now
+            except Exception as exc:
+                self.logger.error(f"Failed to write trade log: {exc}")
+            if done:
+                return
+
+    async def _stop_trade_log_flusher(self) -> None:
+        task = self._trade_log_task
+        self._trade_log_task = None
+        if not task or task.done():
+            return
+        # The sentinel lands behind any queued rows, so they are written before the task exits.
+        self._trade_log_queue.put_nowait(None)
+        await task
+
+    def _write_trade_rows(self, rows: List[TradeRow]) -> None:
+        """Append rows to the trade log's userspace buffer; see _sync_trade_log for durability."""
+        if self._csv_writer is None:
+            self._open_trade_log()
+        self._csv_writer.writerows(_trade_row_values(row) for row in rows)
+
+    def _sync_trade_log(self) -> None:
+        if self._csv_fh is not None:
+            self._csv_fh.flush()
+            os.fsync(self._csv_fh.fileno())
+
+    def _open_trade_log(self) -> None:
+        ensure_dir(self.trades_file)
+        file_exists = Path(self.trades_file).exists()
+        self._csv_fh = open(self.trades_file, "a", newline="", buffering=1 << 16)
+        self._csv_writer = csv.writer(self._csv_fh)
+        if not file_exists:
+            self._csv_writer.writerow(TRADE_LOG_HEADERS)
+
+    def _close_trade_log(self) -> None:
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+        self._csv_fh = None
+        self._csv_writer = None
+
+    async def _portfolio_sync_loop(self) -> None:
+        """Refresh portfolios on their own timer so trade polling never waits behind a sync."""
+        while self.running:
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.portfolio_sync_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self._sync_enabled_portfolios()
+            except Exception as exc:
+                self.logger.error(f"Portfolio sync failed: {exc}")
+
+    async def _stop_portfolio_sync(self) -> None:
+        task = self._portfolio_sync_task
+        self._portfolio_sync_task = None
+        if not task:
+            return
+        task.cancel()
+        # Wait for an in-flight /positions request to unwind before the shared session closes.
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
     async def _sync_enabled_portfolios(self) -> None:
         if not self.portfolio_tracker:
             return
-        tasks = [
-            self.portfolio_tracker.sync_portfolio(t["wallet_address"])
-            for t in self.cfg.get("traders", [])
-            if t.get("enabled")
-        ]
-        if tasks:
-            await asyncio.gather(*tasks)
+
+        async def _bounded(wallet: str) -> Dict[str, Any]:
+            async with self._sync_sema:
+                return await self.portfolio_tracker.sync_portfolio(wallet)
+
+        tasks = [_bounded(t["wallet_address"]) for t in self._enabled_traders]
+        # Consume results as they finish so one slow wallet doesn't hold up the rest.
+        for fut in asyncio.as_completed(tasks):
+            await fut
 
     def _canonical_trade_tracking_cfg(self, cfg: Dict[str, Any], default_log_level: str) -> Dict[str, Any]:
         return {
@@ -338,6 +666,7 @@ class CopyTraderApp:
             state_path=desired["state_path"],
             poll_interval=desired["poll_interval"],
             log_level=desired["log_level"],
+            session=self.http_session,
         )
         self.trade_recorder_task = asyncio.create_task(self.trade_recorder.run())
         self._active_trade_tracking_cfg = desired
@@ -367,7 +696,12 @@ def cli():
 def start(config: str):
     """Start monitoring and copying all enabled traders."""
     app = CopyTraderApp(config)
-    asyncio.run(app.run())
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup (not available on Windows)
+        asyncio.run(app.run())
+    else:
+        uvloop.run(app.run())
 
 
 @cli.command()
@@ -428,8 +762,16 @@ def track_trades(config: str, output_dir: str, state_path: str, poll_interval: i
         log_level=log_level,
     )
 
+    from .http_pool import close_shared_session
+
+    async def _run_recorder() -> None:
+        try:
+            await recorder.run()
+        finally:
+            await close_shared_session()
+
     try:
-        asyncio.run(recorder.run())
+        asyncio.run(_run_recorder())
     except KeyboardInterrupt:
         click.echo("Stopped trade tracking.")
 
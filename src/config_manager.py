@@ -1,15 +1,50 @@
+import logging
 import os
+import re
+from dataclasses import dataclass
 from typing import Any, Dict
 
 import yaml
 
 from .utils import expand_env_ref
 
+# Prefer the libyaml-backed C loader; PyYAML builds without libyaml only ship the Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
+    logging.getLogger("copytrader").warning(
+        "PyYAML was built without libyaml; falling back to the slower pure-Python config loader."
+    )
+
+
+_ADDR_RE = re.compile(r"0x[0-9a-f]{40}")
+
 
 class ConfigError(Exception):
     pass
 
 
+@dataclass(slots=True)
+class MonitoringCfg:
+    """Coerced numeric view of the ``monitoring`` block (stored as cfg["monitoring_typed"])."""
+
+    poll_interval: int
+    portfolio_sync_interval: int
+    max_sync_concurrency: int
+    max_poll_concurrency: int
+
+    @classmethod
+    def from_dict(cls, mon: Dict[str, Any]) -> "MonitoringCfg":
+        return cls(
+            poll_interval=int(mon.get("poll_interval", 0)) or 5,
+            portfolio_sync_interval=int(mon.get("portfolio_sync_interval", 0)) or 60,
+            max_sync_concurrency=int(mon.get("max_sync_concurrency", 16)),
+            max_poll_concurrency=int(mon.get("max_poll_concurrency", 16)),
+        )
+
+
 class ConfigManager:
     def __init__(self, path: str):
         self.path = path
@@ -23,7 +58,7 @@ class ConfigManager:
         if not os.path.exists(self.path):
             raise ConfigError(f"Config not found: {self.path}")
         with open(self.path, "r") as f:
-            raw = yaml.safe_load(f)
+            raw = yaml.load(f, Loader=_YamlLoader)
 
         # Expand env:VAR references recursively
         expanded = self._expand(raw)
@@ -54,7 +89,7 @@ class ConfigManager:
         # Validate addresses
         for t in traders:
             addr = str(t.get("wallet_address", "")).lower()
-            if not addr.startswith("0x") or len(addr) != 42:
+            if not _ADDR_RE.fullmatch(addr):
                 raise ConfigError(f"Invalid wallet address for trader '{t.get('name','?')}': {addr}")
 
         # Risk checks sanity
@@ -66,4 +101,8 @@ class ConfigManager:
         mon = cfg.get("monitoring", {})
         if int(mon.get("poll_interval", 0)) <= 0:
             raise ConfigError("monitoring.poll_interval must be > 0")
+        for key in ("max_poll_concurrency", "max_sync_concurrency"):
+            if key in mon and int(mon[key]) <= 0:
+                raise ConfigError(f"monitoring.{key} must be > 0")
+        cfg["monitoring_typed"] = MonitoringCfg.from_dict(mon)
 
@@ -0,0 +1,72 @@
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency
+    FileSystemEventHandler = object  # type: ignore
+    Observer = None  # type: ignore
+
+
+class _ConfigEventHandler(FileSystemEventHandler):  # type: ignore[misc]
+    """Forwards filesystem events for a single file into an asyncio queue."""
+
+    def __init__(self, filename: str, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__()
+        self.filename = filename
+        self.loop = loop
+        self.queue = queue
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory:
+            return
+        paths = (getattr(event, "src_path", ""), getattr(event, "dest_path", ""))
+        if not any(p and Path(p).name == self.filename for p in paths):
+            return
+        # Called from the observer thread; hand the event over to the event loop.
+        self.loop.call_soon_threadsafe(self._notify)
+
+    def _notify(self) -> None:
+        if self.queue.empty():
+            self.queue.put_nowait(None)
+
+
+class ConfigWatcher:
+    """Watches the config file's directory and signals changes via an asyncio queue.
+
+    Falls back to a no-op (``start`` returns False) when watchdog is not installed,
+    in which case callers should keep polling the file mtime.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path).resolve()
+        self.events: asyncio.Queue = asyncio.Queue()
+        self._observer = None
+
+    @property
+    def active(self) -> bool:
+        return self._observer is not None
+
+    def start(self) -> bool:
+        if Observer is None or not self.path.parent.exists():
+            return False
+        handler = _ConfigEventHandler(self.path.name, asyncio.get_running_loop(), self.events)
+        observer = Observer()
+        try:
+            observer.schedule(handler, str(self.path.parent), recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception:
+            return False
+        self._observer = observer
+        return True
+
+    def stop(self) -> None:
+        observer: Optional[Observer] = self._observer  # type: ignore[valid-type]
+        self._observer = None
+        if observer is None:
+            return
+        observer.stop()
+        observer.join(timeout=2)
@@ -1,6 +1,10 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
+from cachetools import TTLCache
+
 
 class MissingDependency(Exception):
     pass
@@ -39,8 +43,11 @@ class TradeExecutor:
         private_key = account_cfg.get("private_key")
         signature_type = int(account_cfg.get("signature_type", 1))
         proxy_address = account_cfg.get("proxy_address")
-        self.min_order_size_cache: Dict[str, float] = {}
+        # Bounded, and entries expire so recalibrated market minimums are picked up.
+        self.min_order_size_cache: TTLCache = TTLCache(maxsize=4096, ttl=600)
         self.logger = logging.getLogger("copytrader")
+        # py-clob-client is synchronous; its network calls run here so they don't block the event loop.
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="clob")
 
         self.client = ClobClient(
             host,
@@ -69,21 +76,28 @@ class TradeExecutor:
         self.client.set_api_creds(creds)
         self._refresh_collateral()
 
-    def _get_min_order_size(self, token_id: str) -> float:
-        if token_id in self.min_order_size_cache:
-            return self.min_order_size_cache[token_id]
+    async def _run_blocking(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    async def _get_min_order_size(self, token_id: str) -> float:
+        cached = self.min_order_size_cache.get(token_id)
+        if cached is not None:
+            return cached
         try:
-            book = self.client.get_order_book(token_id)
+            book = await self._run_blocking(self.client.get_order_book, token_id)
             min_size = float(getattr(book, "min_order_size", 0.0) or 0.0)
         except Exception:
             min_size = 0.0
         self.min_order_size_cache[token_id] = min_size
         return min_size
 
-    def _apply_minimums(self, token_id: str, price: float, shares: float) -> Dict[str, Any]:
+    async def _apply_minimums(self, token_id: str, price: float, shares: float) -> Dict[str, Any]:
         price = max(price, 1e-9)
         min_shares_usd = MIN_ORDER_USD / price
-        min_shares_market = self._get_min_order_size(token_id)
+        min_shares_market = await self._get_min_order_size(token_id)
         min_shares = max(min_shares_usd, min_shares_market)
 
         adjusted_shares = shares
@@ -118,7 +132,7 @@ class TradeExecutor:
             token_id = str(original_trade["tokenID"])
             price = float(original_trade["price"])
 
-            minimums = self._apply_minimums(token_id, price, mirror_shares)
+            minimums = await self._apply_minimums(token_id, price, mirror_shares)
             adjusted_shares = minimums["shares"]
             adjusted_usd = minimums["usd"]
 
@@ -129,8 +143,8 @@ class TradeExecutor:
                 token_id=token_id,
             )
 
-            signed = self.client.create_order(order_args)
-            result = self.client.post_order(signed, OrderType.GTC)
+            signed = await self._run_blocking(self.client.create_order, order_args)
+            result = await self._run_blocking(self.client.post_order, signed, OrderType.GTC)
 
             return {
                 "success": True,
@@ -146,7 +160,7 @@ class TradeExecutor:
                 self.logger.warning(
                     "Order rejected due to balance/allowance. Refreshing collateral and retrying once."
                 )
-                self._refresh_collateral()
+                await self._run_blocking(self._refresh_collateral)
                 return await self._place_order(original_trade, mirror_shares, allow_refresh=False)
             return {"success": False, "error": message}
 
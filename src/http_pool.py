@@ -0,0 +1,36 @@
+from typing import Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Return the process-wide Data API session, creating it on first use.
+
+    Must be called from inside the running event loop. All components that hit
+    data-api.polymarket.com share its connection pool and DNS cache.
+    """
+    global _session
+    if _session is None or _session.closed:
+        # Everything targets one host: cap sockets per host, keep them alive for the server's 75s idle
+        # window, cache DNS for 10 minutes and reap half-closed TLS transports.
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            ttl_dns_cache=600,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=20, connect=5),
+        )
+    return _session
+
+
+async def close_shared_session() -> None:
+    global _session
+    session, _session = _session, None
+    if session is not None and not session.closed:
+        await session.close()
@@ -1,119 +1,161 @@
 import asyncio
+import logging
+import sys
 import time
-from typing import Any, Dict, List
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import aiohttp
 
+from .http_pool import get_shared_session
+from .normalize import extract_trade_fields
+from .utils import json_loads
+
+_by_timestamp = itemgetter("timestamp")
+
 
 class MultiTraderMonitor:
     """Polls Polymarket Data API for trades of configured traders concurrently."""
 
-    def __init__(self, traders_config: List[Dict[str, Any]]):
+    def __init__(
+        self,
+        traders_config: List[Dict[str, Any]],
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrency: int = 16,
+    ):
         self.traders = traders_config
+        self._enabled_traders = [t for t in traders_config if t.get("enabled")]
+        self._enabled_wallets = {t["wallet_address"] for t in self._enabled_traders}
         self.last_check: Dict[str, int] = {}  # wallet -> epoch seconds
         self.data_api_url = "https://data-api.polymarket.com"
+        self.logger = logging.getLogger("copytrader")
+        self._session = session
+        self._max_concurrency = max_concurrency
+        self._gate = asyncio.Semaphore(max_concurrency)  # caps in-flight trade polls
 
-    async def monitor_all_traders(self) -> List[List[Dict[str, Any]]]:
-        tasks = [self.monitor_trader(t) for t in self.traders if t.get("enabled")]
-        return await asyncio.gather(*tasks)
+    async def stream_trade_batches(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield each trader's new trades (oldest → newest) as soon as that trader's poll completes."""
+        tasks = [asyncio.ensure_future(self.monitor_trader(t)) for t in self._enabled_traders]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                batch = await fut
+                if batch:
+                    yield batch
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def monitor_trader(self, trader: Dict[str, Any]) -> List[Dict[str, Any]]:
         wallet = trader["wallet_address"]
         if wallet not in self.last_check:
             # First observation: mark baseline timestamp so we only react to future trades.
-            self.last_check[wallet] = int(time.time())
+            if wallet in self._enabled_wallets:
+                self.last_check[wallet] = int(time.time())
             return []
 
         since = self.last_check.get(wallet, 0)
-        trades = await self._fetch_trades(wallet, limit=100)
-        now = int(time.time())
-        self.last_check[wallet] = now
+        try:
+            async with self._gate:
+                trades = await self._fetch_trades(wallet, limit=100)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            # One slow or failing trader must not end the poll; keep last_check so the next poll retries.
+            self.logger.warning(f"Polling trades for {trader.get('name') or wallet} failed: {exc!r}")
+            return []
+        if wallet not in self._enabled_wallets:
+            # Disabled by a config reload while this poll was in flight: drop the result and leave
+            # last_check unset, so re-enabling the trader starts again from a fresh baseline.
+            return []
+        self.last_check[wallet] = int(time.time())
 
+        # Trader-level fields are the same for every row; read them once per poll.
+        trader_name = trader.get("name")
+        alloc = float(trader.get("allocated_capital", 0.0))
         new_trades: List[Dict[str, Any]] = []
+        append = new_trades.append
         for tr in trades:
             ts = int(tr.get("timestamp", 0))
             if ts <= since:
                 continue
 
             # Normalize fields for downstream usage
-            normalized = {
-                "market": tr.get("conditionId"),
-                "tokenID": tr.get("asset"),
-                "side": tr.get("side"),
-                "size": float(tr.get("size", 0.0)),
-                "price": float(tr.get("price", 0.0)),
+            market, token, side, size, price, title, outcome, tx_hash = extract_trade_fields(tr)
+            append({
+                "market": market,
+                # tokenID/side leave here as str / interned upper-case so consumers can compare directly.
+                "tokenID": str(token or ""),
+                "side": sys.intern((side or "BUY").upper()),
+                "size": float(size or 0.0),
+                "price": float(price or 0.0),
                 "timestamp": ts,
-                "title": tr.get("title"),
-                "outcome": tr.get("outcome"),
-                "transactionHash": tr.get("transactionHash"),
-                "trader_name": trader.get("name"),
+                "title": title,
+                "outcome": outcome,
+                "transactionHash": tx_hash,
+                "trader_name": trader_name,
                 "trader_wallet": wallet,
-                "allocated_capital": float(trader.get("allocated_capital", 0.0)),
-            }
-            new_trades.append(normalized)
+                "allocated_capital": alloc,
+            })
 
         # Most recent first
         aggregated = self._aggregate_trades(new_trades)
-        aggregated.sort(key=lambda x: x["timestamp"])  # oldest → newest
+        aggregated.sort(key=_by_timestamp)  # oldest → newest
         return aggregated
 
     async def _fetch_trades(self, wallet: str, limit: int = 50) -> List[Dict[str, Any]]:
-        async with aiohttp.ClientSession() as session:
-            params = {
-                "user": wallet,
-                "limit": limit,
-                "offset": 0,
-                "takerOnly": "false",
-            }
-            async with session.get(f"{self.data_api_url}/trades", params=params) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
+        params = {
+            "user": wallet,
+            "limit": limit,
+            "offset": 0,
+            "takerOnly": "false",
+        }
+        session = self._session or await get_shared_session()
+        return await self._get_trades(session, params)
+
+    async def _get_trades(self, session: aiohttp.ClientSession, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        async with session.get(f"{self.data_api_url}/trades", params=params) as resp:
+            if resp.status == 200:
+                return json_loads(await resp.read())
+            self.logger.warning(f"Fetching trades for {params['user']} failed with status {resp.status}.")
+            return []
 
     def update_traders(self, traders_config: List[Dict[str, Any]]) -> set:
-        old_enabled = {t["wallet_address"] for t in self.traders if t.get("enabled")}
-        new_enabled = {t["wallet_address"] for t in traders_config if t.get("enabled")}
-        removed = old_enabled - new_enabled
-        for wallet in removed:
+        enabled = [t for t in traders_config if t.get("enabled")]
+        incoming = {t["wallet_address"] for t in enabled}
+        # Diff against the cached set rather than rescanning the previous trader list.
+        for wallet in self._enabled_wallets - incoming:
             self.last_check.pop(wallet, None)
+        added = incoming - self._enabled_wallets
         self.traders = traders_config
-        return new_enabled - old_enabled
+        self._enabled_traders = enabled
+        self._enabled_wallets = incoming
+        return added
 
-    def _aggregate_trades(self, trades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        grouped: Dict[str, Dict[str, Any]] = {}
-        for tr in trades:
-            key = self._aggregation_key(tr)
-            if key not in grouped:
-                grouped[key] = {
-                    **tr,
-                    "_size_sum": 0.0,
-                    "_price_notional": 0.0,
-                    "timestamp": tr["timestamp"],
-                }
-            entry = grouped[key]
-            entry["_size_sum"] += tr["size"]
-            entry["_price_notional"] += tr["price"] * tr["size"]
-            entry["timestamp"] = max(entry["timestamp"], tr["timestamp"])
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """Apply a new poll concurrency cap; polls already holding a slot finish under the old one."""
+        if max_concurrency != self._max_concurrency:
+            self._max_concurrency = max_concurrency
+            self._gate = asyncio.Semaphore(max_concurrency)
 
+    def _aggregate_trades(self, trades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Sort once by aggregation key so each group is a contiguous run for groupby.
+        keyed = sorted(((self._aggregation_key(tr), tr) for tr in trades), key=itemgetter(0))
         aggregated: List[Dict[str, Any]] = []
-        for entry in grouped.values():
-            size = entry["_size_sum"]
-            notional = entry["_price_notional"]
-            price = notional / max(size, 1e-9)
-            entry["size"] = size
-            entry["price"] = price
-            entry.pop("_size_sum", None)
-            entry.pop("_price_notional", None)
-            aggregated.append(entry)
+        for _, group in groupby(keyed, key=itemgetter(0)):
+            _, first = next(group)
+            size = first["size"]
+            notional = first["price"] * first["size"]
+            timestamp = first["timestamp"]
+            for _, tr in group:
+                size += tr["size"]
+                notional += tr["price"] * tr["size"]
+                timestamp = max(timestamp, tr["timestamp"])
+            aggregated.append({**first, "size": size, "price": notional / max(size, 1e-9), "timestamp": timestamp})
         return aggregated
 
-    def _aggregation_key(self, trade: Dict[str, Any]) -> str:
-        tx_hash = str(trade.get("transactionHash") or "").lower()
+    def _aggregation_key(self, trade: Dict[str, Any]) -> tuple:
+        # Tuples hash without building a string; missing fields become ""/0 so keys stay orderable
+        # for the sort in _aggregate_trades (the leading tag keeps the two key shapes apart).
+        tx_hash = trade.get("transactionHash")
         if tx_hash:
-            return f"tx:{tx_hash}:{trade.get('tokenID')}:{trade.get('side')}"
-        return "ts:{timestamp}:{token}:{side}:{price}".format(
-            timestamp=trade.get("timestamp"),
-            token=trade.get("tokenID"),
-            side=trade.get("side"),
-            price=trade.get("price"),
-        )
+            return ("tx", str(tx_hash).lower(), trade["tokenID"], trade["side"])
+        return ("ts", trade.get("timestamp") or 0, trade["tokenID"], trade["side"], trade.get("price") or 0.0)
@@ -0,0 +1,14 @@
+from operator import itemgetter
+from typing import Any, Dict
+
+# Data API trade fields shared by the live monitor and the trade history recorder.
+TRADE_FIELD_NAMES = ("conditionId", "asset", "side", "size", "price", "title", "outcome", "transactionHash")
+_trade_fields = itemgetter(*TRADE_FIELD_NAMES)
+
+
+def extract_trade_fields(tr: Dict[str, Any]) -> tuple:
+    """Pull TRADE_FIELD_NAMES in one C call; rows missing a key fall back to .get()."""
+    try:
+        return _trade_fields(tr)
+    except KeyError:
+        return tuple(tr.get(name) for name in TRADE_FIELD_NAMES)
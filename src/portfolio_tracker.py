@@ -1,23 +1,26 @@
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from .http_pool import get_shared_session
+from .utils import json_loads
 
 
 class PortfolioTracker:
     """Tracks trader portfolios and deployment rates using Polymarket Data API."""
 
-    def __init__(self) -> None:
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
         self.portfolios: Dict[str, float] = {}
         self.deployed_capital: Dict[str, float] = {}
         self.deployment_rates: Dict[str, float] = {}
         self.data_api_url = "https://data-api.polymarket.com"
+        self._session = session
+        self.version = 0  # bumped whenever a tracked value actually changes
 
     async def sync_portfolio(self, wallet_address: str) -> Dict[str, Any]:
         positions = await self._fetch_positions(wallet_address)
 
         if not positions:
-            self.portfolios[wallet_address] = 0.0
-            self.deployed_capital[wallet_address] = 0.0
-            self.deployment_rates[wallet_address] = 0.0
+            self._store(wallet_address, 0.0, 0.0, 0.0)
             return {
                 "total_portfolio": 0.0,
                 "deployed": 0.0,
@@ -33,9 +36,7 @@ class PortfolioTracker:
         total_value = deployed if deployed > 0 else initial_investment
         deployment_rate = min(deployed / total_value, 1.0) if total_value > 0 else 0.0
 
-        self.portfolios[wallet_address] = float(total_value)
-        self.deployed_capital[wallet_address] = float(deployed)
-        self.deployment_rates[wallet_address] = float(deployment_rate)
+        self._store(wallet_address, float(total_value), float(deployed), float(deployment_rate))
 
         return {
             "total_portfolio": total_value,
@@ -45,18 +46,32 @@ class PortfolioTracker:
             "position_count": len(positions),
         }
 
+    def _store(self, wallet_address: str, total_value: float, deployed: float, deployment_rate: float) -> None:
+        if (
+            self.portfolios.get(wallet_address) != total_value
+            or self.deployed_capital.get(wallet_address) != deployed
+            or self.deployment_rates.get(wallet_address) != deployment_rate
+        ):
+            self.version += 1
+        self.portfolios[wallet_address] = total_value
+        self.deployed_capital[wallet_address] = deployed
+        self.deployment_rates[wallet_address] = deployment_rate
+
     async def _fetch_positions(self, wallet_address: str):
-        async with aiohttp.ClientSession() as session:
-            params = {
-                "user": wallet_address,
-                "sortBy": "TOKENS",
-                "sortDirection": "DESC",
-                "sizeThreshold": 0.1,
-            }
-            async with session.get(f"{self.data_api_url}/positions", params=params) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
+        params = {
+            "user": wallet_address,
+            "sortBy": "TOKENS",
+            "sortDirection": "DESC",
+            "sizeThreshold": 0.1,
+        }
+        session = self._session or await get_shared_session()
+        return await self._get_positions(session, params)
+
+    async def _get_positions(self, session: aiohttp.ClientSession, params: Dict[str, Any]):
+        async with session.get(f"{self.data_api_url}/positions", params=params) as resp:
+            if resp.status == 200:
+                return json_loads(await resp.read())
+            return []
 
     def get_deployment_rate(self, wallet_address: str) -> float:
         return self.deployment_rates.get(wallet_address, 1.0)
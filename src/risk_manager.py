@@ -1,4 +1,4 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 
 MIN_ORDER_USD = 1.0
@@ -6,11 +6,11 @@ MIN_ORDER_USD = 1.0
 
 class RiskManager:
     def __init__(self, config: Dict[str, Any], portfolio_tracker):
-        self.config = config
         self.portfolio_tracker = portfolio_tracker
         self.current_exposure_usd: Dict[str, float] = {}  # trader_wallet -> USD
         self.global_exposure_usd: float = 0.0
         self.positions_usd: Dict[str, Dict[str, float]] = {}  # trader_wallet -> token_id -> USD
+        self.update_config(config)
 
     def calculate_mirror(self, trade: Dict[str, Any]) -> Tuple[float, str, float]:
         """
@@ -19,20 +19,37 @@ class RiskManager:
         - reason (str)
         - mirror_usd (float)
         """
-        trader_wallet = trade["trader_wallet"]
-        allocated_capital = float(trade["allocated_capital"])  # USD
-        price = float(trade.get("price", 0.0))
-        size = float(trade.get("size", 0.0))
-
-        # Trader portfolio value (USD)
+        context = self._sizing_context(trade["trader_wallet"], float(trade["allocated_capital"]))
+        return self._size_mirror(context, float(trade.get("price", 0.0)), float(trade.get("size", 0.0)))
+
+    def calculate_mirror_batch(self, trades: List[Dict[str, Any]]) -> List[Tuple[float, str, float]]:
+        """Same as calculate_mirror for each trade, resolving per-trader inputs once per wallet."""
+        contexts: Dict[Tuple[str, float], Tuple[float, float, float]] = {}
+        results: List[Tuple[float, str, float]] = []
+        for trade in trades:
+            key = (trade["trader_wallet"], float(trade["allocated_capital"]))
+            context = contexts.get(key)
+            if context is None:
+                context = contexts[key] = self._sizing_context(*key)
+            results.append(
+                self._size_mirror(context, float(trade.get("price", 0.0)), float(trade.get("size", 0.0)))
+            )
+        return results
+
+    def _sizing_context(self, trader_wallet: str, allocated_capital: float) -> Tuple[float, float, float]:
+        """Return (trader portfolio USD, effective allocation USD, deployment rate) for a trader."""
         trader_portfolio = float(self.portfolio_tracker.portfolios.get(trader_wallet, 0.0))
-        if trader_portfolio <= 0.0 or price <= 0.0 or size <= 0.0:
-            return 0.0, "Insufficient data for proportional sizing", 0.0
-
         # Adjust allocated capital by trader deployment rate
         effective_alloc, deployment_rate = self.portfolio_tracker.calculate_effective_allocation(
             trader_wallet, allocated_capital
         )
+        return trader_portfolio, effective_alloc, deployment_rate
+
+    @staticmethod
+    def _size_mirror(context: Tuple[float, float, float], price: float, size: float) -> Tuple[float, str, float]:
+        trader_portfolio, effective_alloc, deployment_rate = context
+        if trader_portfolio <= 0.0 or price <= 0.0 or size <= 0.0:
+            return 0.0, "Insufficient data for proportional sizing", 0.0
 
         # Trade value in USD and proportion of trader portfolio
         trade_value_usd = size * price
@@ -52,11 +69,11 @@ class RiskManager:
 
     def validate_trade(self, trade: Dict[str, Any], mirror_shares: float, mirror_usd: float) -> Tuple[bool, str]:
         trader_wallet = trade["trader_wallet"]
-        token_id = str(trade.get("tokenID"))
-        side = str(trade.get("side", "BUY")).upper()
+        token_id = trade["tokenID"]
+        side = trade["side"]
 
         # Check 1: Absolute max single bet (USD)
-        if mirror_usd > float(self.config["global"]["max_single_bet"]):
+        if mirror_usd > self._max_single_bet:
             return False, f"Exceeds max single bet: ${mirror_usd:.2f}"
 
         # Check 2: Per-trader max position percentage of allocated
@@ -64,14 +81,13 @@ class RiskManager:
         effective_allocated = max(raw_allocated, MIN_ORDER_USD)
         if side == "BUY":
             position_pct = mirror_usd / effective_allocated
-            max_pct = float(self.config["per_trader"]["max_position_pct"]) or 1.0
-            if position_pct > max_pct:
+            if position_pct > self._max_position_pct:
                 return False, f"Exceeds max position %: {position_pct*100:.1f}%"
 
         # Check 3: Global exposure limit
         delta = self._simulate_exposure_delta(trader_wallet, token_id, mirror_usd, side)
         new_global = max(self.global_exposure_usd + delta, 0.0)
-        if new_global > float(self.config["global"]["max_total_exposure"]):
+        if new_global > self._max_total_exposure:
             return False, f"Exceeds global exposure: ${new_global:.2f}"
 
         # Check 4: Per-trader exposure against allocated capital
@@ -86,8 +102,8 @@ class RiskManager:
 
     def update_exposure(self, trade: Dict[str, Any], mirror_usd: float) -> None:
         trader_wallet = trade["trader_wallet"]
-        token_id = str(trade.get("tokenID"))
-        side = str(trade.get("side", "BUY")).upper()
+        token_id = trade["tokenID"]
+        side = trade["side"]
         delta = self._apply_position_change(trader_wallet, token_id, mirror_usd, side)
         self.current_exposure_usd[trader_wallet] = max(
             self.current_exposure_usd.get(trader_wallet, 0.0) + delta, 0.0
@@ -95,7 +111,15 @@ class RiskManager:
         self.global_exposure_usd = max(self.global_exposure_usd + delta, 0.0)
 
     def update_config(self, config: Dict[str, Any]) -> None:
+        # Resolved once per (re)load so validate_trade does no dict walks or float() calls.
+        # Read everything first: a missing key raises before any limit is replaced.
+        max_single_bet = float(config["global"]["max_single_bet"])
+        max_total_exposure = float(config["global"]["max_total_exposure"])
+        max_position_pct = float(config["per_trader"]["max_position_pct"]) or 1.0
         self.config = config
+        self._max_single_bet = max_single_bet
+        self._max_total_exposure = max_total_exposure
+        self._max_position_pct = max_position_pct
 
     def _simulate_exposure_delta(self, wallet: str, token_id: str, mirror_usd: float, side: str) -> float:
         if side == "SELL":
@@ -1,13 +1,16 @@
 import asyncio
-import csv
 import logging
-from datetime import datetime, timezone
+import os
+import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import aiohttp
 
-from .utils import ensure_dir, persist_state, read_state
+from .http_pool import get_shared_session
+from .normalize import extract_trade_fields
+from .utils import ensure_dir, gather_with_limit, json_dumps, json_loads, persist_state, read_state
 
 
 TRADE_HEADERS = [
@@ -23,6 +26,21 @@ TRADE_HEADERS = [
     "outcome",
 ]
 
+BOOTSTRAP_PAGE_WINDOW = 8  # history pages requested concurrently per trader during bootstrap
+STATE_SNAPSHOT_EVERY = 20  # poll cycles between full state snapshots; the journal covers the rest
+MAX_EMPTY_STREAK = 6  # quiet traders are polled at least every 2**6 = 64 cycles
+
+_by_timestamp = itemgetter("timestamp")
+_CSV_HEADER_LINE = ",".join(TRADE_HEADERS) + "\r\n"
+
+
+def _csv_escape(value: Any) -> str:
+    """Quote a CSV field only when it contains a delimiter, quote or line break."""
+    text = str(value)
+    if "," in text or '"' in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
 
 class TradeHistoryRecorder:
     """Fetches and persist trades for all enabled traders to per-trader CSV files."""
@@ -35,8 +53,10 @@ class TradeHistoryRecorder:
         poll_interval: int = 30,
         page_size: int = 200,
         log_level: str = "INFO",
+        session: Optional[aiohttp.ClientSession] = None,
+        max_parallel: int = 8,
     ) -> None:
-        self.traders = [t for t in traders_config if t.get("enabled")]
+        self._enabled_traders: Tuple[Dict[str, Any], ...] = tuple(t for t in traders_config if t.get("enabled"))
         self.output_dir = Path(output_dir)
         self.state_path = state_path
         self.poll_interval = max(poll_interval, 5)
@@ -45,7 +65,18 @@ class TradeHistoryRecorder:
         self.logger = self._build_logger(log_level)
         self.state: Dict[str, Any] = read_state(self.state_path) or {}
         self.trader_state: Dict[str, Dict[str, Any]] = self.state.get("per_trader", {})
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._journal_path = str(Path(state_path).with_suffix(".jnl"))
+        self._replay_journal()
+        self._session = session
+        self._log_exists: Dict[str, bool] = {}  # log path -> file known to exist (skips per-append stat)
+        self._state_dirty = False  # set on trader_state changes; flushed once per poll cycle
+        self._dirty_wallets: Set[str] = set()  # wallets to journal on the next flush
+        self._cycles_since_snapshot = 0
+        self._empty_streak: Dict[str, int] = {}  # wallet -> consecutive polls with no new trades
+        self._idle_cycles: Dict[str, int] = {}  # wallet -> cycles skipped since its last poll
+        self._persist_task: Optional[asyncio.Task] = None
+        self._max_parallel = max(max_parallel, 1)
+        self._page_gate = asyncio.Semaphore(BOOTSTRAP_PAGE_WINDOW)  # caps concurrent bootstrap page requests
         self._trader_update_event = asyncio.Event()
         self._pending_traders: Optional[List[Dict[str, Any]]] = None
 
@@ -60,37 +91,51 @@ class TradeHistoryRecorder:
         return logger
 
     async def run(self) -> None:
-        if not self.traders:
+        if not self._enabled_traders:
             self.logger.info("No enabled traders found in configuration.")
             return
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
         try:
-            async with aiohttp.ClientSession() as session:
-                self._session = session
-                await self._bootstrap_traders()
-                while True:
-                    await self._apply_pending_updates()
-                    await self._sync_new_trades()
-                    await asyncio.sleep(self.poll_interval)
+            await self._bootstrap_traders()
+            while True:
+                await self._apply_pending_updates()
+                await self._sync_new_trades()
+                self._cycles_since_snapshot += 1
+                if self._state_dirty:
+                    self._schedule_persist()
+                await asyncio.sleep(self.poll_interval)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
             self.logger.error(f"Trade recorder stopped due to error: {exc}")
             raise
         finally:
-            self._persist_state()
-            self._session = None
+            # Let an in-flight background write land before the final synchronous one.
+            if self._persist_task is not None and not self._persist_task.done():
+                try:
+                    await self._persist_task
+                except Exception:
+                    pass
+            # Fold any journal into a fresh snapshot so a clean shutdown leaves no .jnl to replay.
+            if self._state_dirty or os.path.exists(self._journal_path):
+                self._persist_state()
 
     async def _bootstrap_traders(self) -> None:
-        for trader in self.traders:
-            wallet = trader["wallet_address"]
-            log_path = self._log_path(trader)
-            state = self.trader_state.get(wallet)
-            if state and log_path.exists():
-                continue
+        pending = [
+            t
+            for t in self._enabled_traders
+            if not (self.trader_state.get(t["wallet_address"]) and self._log_path(t).exists())
+        ]
+        if not pending:
+            return
 
-            trades = await self._fetch_all_trades(wallet)
+        results = await asyncio.gather(*[self._bootstrap_one(t) for t in pending], return_exceptions=True)
+        for trader, trades in zip(pending, results):
+            if isinstance(trades, BaseException):
+                self.logger.error(f"Bootstrapping history for {self._label(trader)} failed: {trades}")
+                continue
+            wallet = trader["wallet_address"]
             if trades:
                 self.logger.info(
                     f"Bootstrapping history for {self._label(trader)} with {len(trades)} trades."
@@ -106,19 +151,27 @@ class TradeHistoryRecorder:
                 self.logger.info(f"No trades found for {self._label(trader)}; writing empty log.")
                 self._write_full_log(trader, [])
                 self.trader_state.setdefault(wallet, {"last_timestamp": 0, "last_hashes": []})
-            self._persist_state()
+            self._mark_dirty(wallet)
+
+    async def _bootstrap_one(self, trader: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._fetch_all_trades(trader["wallet_address"])
 
     async def _sync_new_trades(self) -> None:
-        for trader in self.traders:
+        traders = self._due_traders()
+        # Fetch every trader concurrently, then write logs and state one trader at a time.
+        results = await gather_with_limit(
+            self._max_parallel, *[self._sync_one(t) for t in traders], return_exceptions=True
+        )
+        for trader, new_trades in zip(traders, results):
+            if isinstance(new_trades, BaseException):
+                self.logger.error(f"Syncing trades for {self._label(trader)} failed: {new_trades}")
+                continue
             wallet = trader["wallet_address"]
-            state = self.trader_state.setdefault(wallet, {"last_timestamp": 0, "last_hashes": []})
-            last_ts = int(state.get("last_timestamp", 0))
-            last_hashes = state.get("last_hashes", [])
-
-            new_trades = await self._fetch_new_trades(wallet, last_ts, last_hashes)
             if not new_trades:
+                self._empty_streak[wallet] = min(self._empty_streak.get(wallet, 0) + 1, MAX_EMPTY_STREAK)
                 continue
 
+            self._empty_streak[wallet] = 0
             self._append_trades(trader, new_trades)
             latest_ts = new_trades[-1]["timestamp"]
             latest_hashes = [t["transaction_hash"] for t in new_trades if t["timestamp"] == latest_ts]
@@ -126,24 +179,49 @@ class TradeHistoryRecorder:
                 "last_timestamp": latest_ts,
                 "last_hashes": latest_hashes,
             }
+            self._mark_dirty(wallet)
             self.logger.info(
                 f"Recorded {len(new_trades)} trades for {self._label(trader)} (latest ts {latest_ts})."
             )
-            self._persist_state()
+
+    def _due_traders(self) -> List[Dict[str, Any]]:
+        """Enabled traders to poll this cycle; after k empty polls a trader waits 2**k cycles."""
+        due: List[Dict[str, Any]] = []
+        for trader in self._enabled_traders:
+            wallet = trader["wallet_address"]
+            streak = self._empty_streak.get(wallet, 0)
+            if streak:
+                waited = self._idle_cycles.get(wallet, 0) + 1
+                if waited < 1 << streak:
+                    self._idle_cycles[wallet] = waited
+                    continue
+            self._idle_cycles[wallet] = 0
+            due.append(trader)
+        return due
+
+    async def _sync_one(self, trader: Dict[str, Any]) -> List[Dict[str, Any]]:
+        wallet = trader["wallet_address"]
+        state = self.trader_state.setdefault(wallet, {"last_timestamp": 0, "last_hashes": []})
+        last_ts = int(state.get("last_timestamp", 0))
+        last_hashes = state.get("last_hashes", [])
+        return await self._fetch_new_trades(wallet, last_ts, last_hashes)
 
     async def _fetch_all_trades(self, wallet: str) -> List[Dict[str, Any]]:
-        trades: List[Dict[str, Any]] = []
-        offset = 0
-        while True:
-            batch = await self._fetch_trades_batch(wallet, offset)
-            if not batch:
-                break
-            trades.extend(batch)
-            if len(batch) < self.page_size:
-                break
-            offset += self.page_size
+        trades: List[Dict[str, Any]] = list(await self._fetch_page(wallet, 0))
+        last_len = len(trades)
+        offset = self.page_size
+        # A full first page means more history: request the next pages a window at a time.
+        while last_len >= self.page_size:
+            offsets = range(offset, offset + self.page_size * BOOTSTRAP_PAGE_WINDOW, self.page_size)
+            batches = await asyncio.gather(*[self._fetch_page(wallet, off) for off in offsets])
+            for batch in batches:
+                trades.extend(batch)
+                last_len = len(batch)
+                if last_len < self.page_size:
+                    break
+            offset += self.page_size * BOOTSTRAP_PAGE_WINDOW
         normalized = [self._normalize_trade(wallet, tr) for tr in trades]
-        normalized.sort(key=lambda t: t["timestamp"])
+        normalized.sort(key=_by_timestamp)
         return normalized
 
     async def _fetch_new_trades(
@@ -151,16 +229,19 @@ class TradeHistoryRecorder:
     ) -> List[Dict[str, Any]]:
         collected: List[Dict[str, Any]] = []
         offset = 0
-        last_hash_set = set(last_hashes or [])
 
         while True:
             batch = await self._fetch_trades_batch(wallet, offset)
             if not batch:
                 break
-            normalized = [self._normalize_trade(wallet, tr) for tr in batch]
-            collected.extend(normalized)
+            min_ts = None
+            for tr in batch:
+                ts = int(tr.get("timestamp", 0))
+                if min_ts is None or ts < min_ts:
+                    min_ts = ts
+                if ts >= last_timestamp:
+                    collected.append(self._normalize_trade(wallet, tr))
 
-            min_ts = min((t["timestamp"] for t in normalized), default=None)
             if len(batch) < self.page_size or (min_ts is not None and min_ts < last_timestamp):
                 break
             offset += self.page_size
@@ -168,23 +249,25 @@ class TradeHistoryRecorder:
         if not collected:
             return []
 
-        collected.sort(key=lambda t: t["timestamp"])
+        collected.sort(key=_by_timestamp)
+        if not last_hashes:
+            return collected  # nothing recorded at last_timestamp, so nothing to dedupe
+        last_hash_set = frozenset(last_hashes)
         new_trades = []
         for trade in collected:
             ts = trade["timestamp"]
-            tx_hash = trade["transaction_hash"]
-            if ts < last_timestamp:
-                continue
-            if ts == last_timestamp and tx_hash in last_hash_set:
+            if ts == last_timestamp and trade["transaction_hash"] in last_hash_set:
                 continue
             new_trades.append(trade)
 
         return new_trades
 
-    async def _fetch_trades_batch(self, wallet: str, offset: int) -> List[Dict[str, Any]]:
-        if not self._session:
-            raise RuntimeError("TradeHistoryRecorder session is not initialized.")
+    async def _fetch_page(self, wallet: str, offset: int) -> List[Dict[str, Any]]:
+        async with self._page_gate:
+            return await self._fetch_trades_batch(wallet, offset)
 
+    async def _fetch_trades_batch(self, wallet: str, offset: int) -> List[Dict[str, Any]]:
+        session = self._session or await get_shared_session()
         params = {
             "user": wallet,
             "limit": self.page_size,
@@ -192,9 +275,9 @@ class TradeHistoryRecorder:
             "takerOnly": "false",
         }
         try:
-            async with self._session.get(f"{self.data_api_url}/trades", params=params) as resp:
+            async with session.get(f"{self.data_api_url}/trades", params=params) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return json_loads(await resp.read())
                 self.logger.warning(
                     f"Fetching trades for {wallet} failed with status {resp.status}."
                 )
@@ -206,39 +289,39 @@ class TradeHistoryRecorder:
         if not trades:
             return
         log_path = self._log_path(trader)
-        ensure_dir(str(log_path))
-        file_exists = log_path.exists()
-        with open(log_path, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=TRADE_HEADERS)
+        key = str(log_path)
+        file_exists = self._log_exists.get(key)
+        if file_exists is None:
+            ensure_dir(key)
+            file_exists = log_path.exists()
+        with open(log_path, "a", buffering=1 << 16, newline="") as f:
             if not file_exists:
-                writer.writeheader()
-            for trade in trades:
-                writer.writerow(self._format_row(trade))
+                f.write(_CSV_HEADER_LINE)
+            f.writelines(map(self._format_line, trades))
+        self._log_exists[key] = True
 
     def _write_full_log(self, trader: Dict[str, Any], trades: List[Dict[str, Any]]) -> None:
         log_path = self._log_path(trader)
         ensure_dir(str(log_path))
-        with open(log_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=TRADE_HEADERS)
-            writer.writeheader()
-            for trade in trades:
-                writer.writerow(self._format_row(trade))
+        with open(log_path, "w", buffering=1 << 16, newline="") as f:
+            f.write(_CSV_HEADER_LINE)
+            f.writelines(map(self._format_line, trades))
+        self._log_exists[str(log_path)] = True
 
-    def _format_row(self, trade: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _format_line(trade: Dict[str, Any]) -> str:
+        """Render one TRADE_HEADERS row exactly as csv.writer would (minimal quoting, CRLF)."""
         ts = int(trade.get("timestamp", 0))
-        timestamp_iso = datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
-        return {
-            "timestamp_iso": timestamp_iso,
-            "timestamp_unix": ts,
-            "transaction_hash": trade.get("transaction_hash", ""),
-            "side": trade.get("side", ""),
-            "size": f"{float(trade.get('size', 0.0)):.6f}",
-            "price": f"{float(trade.get('price', 0.0)):.6f}",
-            "market": trade.get("market", ""),
-            "token_id": trade.get("token_id", ""),
-            "title": trade.get("title", ""),
-            "outcome": trade.get("outcome", ""),
-        }
+        # Same output as datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(), minus the object churn.
+        t = time.gmtime(ts)
+        timestamp_iso = "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % t[:6]
+        # Hashes, ids, sides and formatted numbers never need quoting; free-text fields might.
+        return (
+            f"{timestamp_iso},{ts},{trade.get('transaction_hash', '')},{trade.get('side', '')},"
+            f"{float(trade.get('size', 0.0)):.6f},{float(trade.get('price', 0.0)):.6f},"
+            f"{trade.get('market', '')},{trade.get('token_id', '')},"
+            f"{_csv_escape(trade.get('title', ''))},{_csv_escape(trade.get('outcome', ''))}\r\n"
+        )
 
     def _log_path(self, trader: Dict[str, Any]) -> Path:
         wallet = trader["wallet_address"].lower()
@@ -252,22 +335,101 @@ class TradeHistoryRecorder:
         return trader.get("name") or trader.get("wallet_address")
 
     def _normalize_trade(self, wallet: str, trade: Dict[str, Any]) -> Dict[str, Any]:
+        market, token, side, size, price, title, outcome, tx_hash = extract_trade_fields(trade)
         return {
             "timestamp": int(trade.get("timestamp", 0)),
-            "transaction_hash": str(trade.get("transactionHash", "") or ""),
-            "side": str(trade.get("side", "")).upper(),
-            "size": float(trade.get("size", 0.0)),
-            "price": float(trade.get("price", 0.0)),
-            "market": trade.get("conditionId") or "",
-            "token_id": trade.get("asset") or "",
-            "title": trade.get("title") or "",
-            "outcome": trade.get("outcome") or "",
+            "transaction_hash": str(tx_hash or ""),
+            "side": str(side or "").upper(),
+            "size": float(size or 0.0),
+            "price": float(price or 0.0),
+            "market": market or "",
+            "token_id": token or "",
+            "title": title or "",
+            "outcome": outcome or "",
             "trader_wallet": wallet,
         }
 
+    def _schedule_persist(self) -> None:
+        """Write state from a worker thread; coalesces with a write that is already running."""
+        if self._persist_task is not None and not self._persist_task.done():
+            return  # the running task loops until _state_dirty stays clear
+        self._persist_task = asyncio.create_task(self._persist_in_background())
+
+    async def _persist_in_background(self) -> None:
+        while self._state_dirty:
+            self._state_dirty = False
+            wallets, self._dirty_wallets = self._dirty_wallets, set()
+            # Copy on the loop thread; per-trader entries are replaced, never mutated in place.
+            if self._cycles_since_snapshot >= STATE_SNAPSHOT_EVERY:
+                self._cycles_since_snapshot = 0
+                snapshot = {**self.state, "per_trader": dict(self.trader_state)}
+                job = asyncio.to_thread(self._write_snapshot, snapshot)
+            else:
+                entries = [{"wallet": w, **self.trader_state[w]} for w in wallets if w in self.trader_state]
+                job = asyncio.to_thread(self._append_journal, entries)
+            try:
+                await job
+            except Exception as exc:
+                self._state_dirty = True
+                self._dirty_wallets |= wallets
+                self.logger.error(f"Persisting trade history state failed: {exc}")
+                return
+
+    def _mark_dirty(self, wallet: str) -> None:
+        self._dirty_wallets.add(wallet)
+        self._state_dirty = True
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        persist_state(self.state_path, snapshot)
+        self._truncate_journal()
+
+    def _append_journal(self, entries: List[Dict[str, Any]]) -> None:
+        """Append one JSON line per updated trader; O(changes) instead of rewriting the snapshot."""
+        if not entries:
+            return
+        ensure_dir(self._journal_path)
+        with open(self._journal_path, "ab", buffering=0) as f:
+            f.write(b"".join(json_dumps(entry) + b"\n" for entry in entries))
+            os.fsync(f.fileno())
+
+    def _truncate_journal(self) -> None:
+        try:
+            os.remove(self._journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _replay_journal(self) -> None:
+        """Apply journal lines written since the last snapshot on top of the loaded state."""
+        try:
+            raw = Path(self._journal_path).read_bytes()
+        except FileNotFoundError:
+            return
+        for line in raw.splitlines():
+            try:
+                entry = json_loads(line)
+                wallet = entry["wallet"]
+                last_ts = int(entry["last_timestamp"])
+            except Exception:
+                continue  # torn tail from a crash mid-append
+            hashes = entry.get("last_hashes") or []
+            current = self.trader_state.get(wallet)
+            current_ts = int(current.get("last_timestamp", 0)) if current else -1
+            # Lines older than the snapshot (crash between snapshot and truncate) must not roll it back.
+            if last_ts < current_ts:
+                continue
+            if last_ts == current_ts:
+                hashes = list(dict.fromkeys([*current.get("last_hashes", []), *hashes]))
+            self.trader_state[wallet] = {"last_timestamp": last_ts, "last_hashes": hashes}
+        self.state["per_trader"] = self.trader_state
+
     def _persist_state(self) -> None:
         self.state["per_trader"] = self.trader_state
         persist_state(self.state_path, self.state)
+        self._truncate_journal()
+        self._state_dirty = False
+        self._dirty_wallets.clear()
+        self._cycles_since_snapshot = 0
+
     def queue_trader_update(self, traders_config: List[Dict[str, Any]]) -> None:
         """Schedule a trader set update to be processed by the recorder loop."""
         self._pending_traders = traders_config
@@ -281,5 +443,5 @@ class TradeHistoryRecorder:
         self._pending_traders = None
         if not pending:
             return
-        self.traders = [t for t in pending if t.get("enabled")]
+        self._enabled_traders = tuple(t for t in pending if t.get("enabled"))
         await self._bootstrap_traders()
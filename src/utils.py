@@ -1,4 +1,5 @@
-import csv
+import asyncio
+import gzip
 import json
 import logging
 import os
@@ -8,6 +9,43 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+
+# State snapshots larger than this are written gzipped (level 1) to "<path>.gz" instead of
+# "<path>"; only one of the two exists at a time and read_state accepts either.
+STATE_GZIP_THRESHOLD = 64 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def json_loads(data):
+    """Decode JSON from bytes/str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data) -> bytes:
+    """Encode data as compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+async def gather_with_limit(limit: int, *coros, return_exceptions: bool = False) -> list:
+    """asyncio.gather with at most ``limit`` of the awaitables running at once."""
+    sem = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        # Acquire inside the task so no timeout or request starts before a slot is free.
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=return_exceptions)
+
 
 def load_env() -> None:
     """Load environment variables from .env if present."""
@@ -39,16 +77,36 @@ def ensure_dir(path: str) -> None:
 
 def persist_state(state_path: str, data: dict) -> None:
     ensure_dir(state_path)
-    with open(state_path, "w") as f:
-        json.dump(data, f, indent=2)
+    payload = json_dumps(data)
+    gz_path = f"{state_path}.gz"
+    if len(payload) > STATE_GZIP_THRESHOLD:
+        target, stale = gz_path, state_path
+        payload = gzip.compress(payload, compresslevel=1)
+    else:
+        target, stale = state_path, gz_path
+    # Write to a sibling temp file and swap it in so a crash never leaves a truncated state file.
+    tmp_path = f"{target}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, target)
+    # Drop the other form so a plain .json never holds binary and readers never see a stale copy.
+    try:
+        os.remove(stale)
+    except FileNotFoundError:
+        pass
 
 
 def read_state(state_path: str) -> Optional[dict]:
-    p = Path(state_path)
-    if not p.exists():
+    candidates = [p for p in (Path(state_path), Path(f"{state_path}.gz")) if p.exists()]
+    if not candidates:
         return None
+    # Both exist only if a crash hit between the swap and the cleanup; the newer one wins.
+    p = max(candidates, key=lambda c: c.stat().st_mtime)
     try:
-        return json.loads(p.read_text())
+        raw = p.read_bytes()
+        if raw[:2] == _GZIP_MAGIC:
+            raw = gzip.decompress(raw)
+        return json_loads(raw)
     except Exception:
         return None
 
@@ -60,16 +118,3 @@ def expand_env_ref(value: str) -> str:
         return os.getenv(var, "")
     return value
 
-
-def append_csv_row(csv_path: str, headers: list, row: dict) -> None:
-    """Append a row to csv_path, creating the file with headers if needed."""
-    if not csv_path:
-        return
-    ensure_dir(csv_path)
-    csv_file = Path(csv_path)
-    file_exists = csv_file.exists()
-    with open(csv_file, "a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow({h: row.get(h, "") for h in headers})